@@ -1,15 +1,37 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify, stream_with_context
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
-from werkzeug.security import generate_password_hash, check_password_hash
+from werkzeug.security import check_password_hash
+from argon2 import PasswordHasher
+from argon2.exceptions import VerificationError, InvalidHashError
 import joblib
 import os
 import numpy as np
-import json
+import orjson
 import secrets
+import sqlite3
+import threading
 from functools import wraps
-from models import db, User, Prediction, Admin
+from models import db, User, Prediction, Admin, is_yes
+from store import get_store
+from sqlalchemy import event, func, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import joinedload
+
+
+# ============== JSON PROVIDER ==============
+class OrjsonProvider(JSONProvider):
+    """Route jsonify() and request.json through orjson."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app)
 
 # ============== BASE DIR & CONFIG ==============
@@ -22,17 +44,217 @@ app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
 db.init_app(app)
 
-# Simple in-memory token storage (in production, use Redis or database)
-active_tokens = {}
-admin_tokens = {}
+
+# WAL lets readers run alongside the per-request prediction commits, and
+# synchronous=NORMAL drops the fsync on every commit (still safe under WAL)
+@event.listens_for(Engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.close()
+
+
+# Session tokens live in Redis (shared across workers) when REDIS_URL is set,
+# otherwise in a per-process store; either way they expire after TOKEN_TTL
+r = get_store()
+TOKEN_TTL = int(os.environ.get('TOKEN_TTL', 86400))
 
 # ============== LOAD MODEL ==============
 model = joblib.load(os.path.join(BASE_DIR, "model/random_forest_model.pkl"))
 label_encoders = joblib.load(os.path.join(BASE_DIR, "model/label_encoders.pkl"))
 feature_names = joblib.load(os.path.join(BASE_DIR, "model/feature_names.pkl"))
 
+# Single-row requests never benefit from the forest's thread pool
+if hasattr(model, 'named_steps'):
+    model.named_steps['model'].n_jobs = 1
+else:
+    model.n_jobs = 1
+
 print("✓ Model loaded")
 
+# Serve through the Treelite-compiled forest (see model/compile_treelite.py)
+# when it exists; otherwise use the sklearn pipeline directly. ONNX Runtime
+# (see model/export_onnx.py) is opt-in with USE_ONNX=1: its tree ensemble
+# accumulates in float32, so prices drift from sklearn's by up to ~1e-6
+# relative (a few rupees on a ₹1e7 flat)
+try:
+    import tl2cgen
+except ImportError:
+    tl2cgen = None
+
+try:
+    import onnxruntime as ort
+except ImportError:
+    ort = None
+
+lib_path = os.path.join(BASE_DIR, "model/random_forest_model.so")
+onnx_path = os.path.join(BASE_DIR, "model/random_forest_model.onnx")
+USE_ONNX = os.environ.get('USE_ONNX', '0') == '1'
+
+if tl2cgen is not None and os.path.exists(lib_path):
+    predictor = tl2cgen.Predictor(lib_path)
+
+    def predict_price(buf):
+        return predictor.predict(tl2cgen.DMatrix(buf))[0, 0, 0]
+
+    print("✓ Compiled Treelite model loaded")
+elif USE_ONNX and ort is not None and os.path.exists(onnx_path):
+    sess = ort.InferenceSession(onnx_path, providers=['CPUExecutionProvider'])
+    _onnx_input = sess.get_inputs()[0].name
+
+    def predict_price(buf):
+        return sess.run(None, {_onnx_input: buf})[0][0, 0]
+
+    print("✓ ONNX Runtime session loaded")
+else:
+    def predict_price(buf):
+        return model.predict(buf)[0]
+
+# Warm up so the first real request doesn't pay the cold-path cost
+predict_price(np.zeros((1, len(feature_names)), dtype=np.float32))
+
+# Feature-building lookups, computed once instead of per request
+_FURN_MAP = {c: i for i, c in enumerate(label_encoders["furnishingstatus"].classes_)}
+_YN_KEYS = ("mainroad", "guestroom", "basement", "hotwaterheating", "airconditioning", "prefarea")
+
+
+def _furn_code(value):
+    """Encode furnishingstatus; unknown labels are rejected (400), as the encoder did."""
+    code = _FURN_MAP.get(value)
+    if code is None:
+        raise ValueError(f"y contains previously unseen labels: {[value]}")
+    return code
+
+
+# How each request field is parsed into its Prediction column value ...
+_FIELD_PARSERS = {
+    "area": "float(data['area'])",
+    "bedrooms": "int(data['bedrooms'])",
+    "bathrooms": "int(data['bathrooms'])",
+    "stories": "int(data['stories'])",
+    "parking": "int(data['parking'])",
+    "furnishingstatus": "data['furnishingstatus']",
+    # Yes/No → True/False, by the same rule init_db.py migrates old rows with
+    **{k: f"is_yes(data['{k}'])" for k in _YN_KEYS}
+}
+# ... and how that value is encoded into the model input row
+_FIELD_ENCODERS = {
+    "furnishingstatus": "_furn_code({})"
+}
+
+
+def _compile_feature_builder():
+    """Generate build_features(data, buf) specialised to feature_names.
+
+    The generated function parses every field, writes it straight into
+    its column of buf and returns the parsed values keyed by column name,
+    with no loops or lookups over the feature list at request time.
+    """
+    lines = ["def build_features(data, buf):"]
+    for i, name in enumerate(feature_names):
+        lines.append(f"    v{i} = {_FIELD_PARSERS[name]}")
+    for i, name in enumerate(feature_names):
+        lines.append(f"    buf[0, {i}] = {_FIELD_ENCODERS.get(name, '{}').format(f'v{i}')}")
+    lines.append("    return {" + ", ".join(f"'{name}': v{i}" for i, name in enumerate(feature_names)) + "}")
+    
+    namespace = {"_furn_code": _furn_code, "is_yes": is_yes}
+    exec(compile("\n".join(lines), "<build_features>", "exec"), namespace)
+    return namespace["build_features"]
+
+
+build_features = _compile_feature_builder()
+
+# One preallocated (1, n_features) input row per worker thread
+_local = threading.local()
+
+
+def _input_buffer():
+    buf = getattr(_local, "buf", None)
+    if buf is None:
+        buf = _local.buf = np.empty((1, len(feature_names)), dtype=np.float32)
+    return buf
+
+
+# ============== PASSWORD HASHING ==============
+ph = PasswordHasher(time_cost=2, memory_cost=64 * 1024, parallelism=1)
+
+
+def hash_password(password):
+    return ph.hash(password)
+
+
+def verify_password(account, password):
+    """Check password against account.password, upgrading legacy hashes.
+
+    Accounts created before argon2 still hold werkzeug hashes; on a
+    successful login they are re-hashed so the next check uses argon2.
+    """
+    if account.password.startswith('$argon2'):
+        try:
+            ph.verify(account.password, password)
+        except (VerificationError, InvalidHashError):
+            return False
+        if ph.check_needs_rehash(account.password):
+            account.password = ph.hash(password)
+            db.session.commit()
+        return True
+
+    if not check_password_hash(account.password, password):
+        return False
+    account.password = ph.hash(password)
+    db.session.commit()
+    return True
+
+
+# ============== RESPONSE CACHE ==============
+# Admin dashboards poll these endpoints; serve them from the store for a
+# short while instead of hitting the database on every poll
+STATS_CACHE_TTL = 30
+MODEL_INFO_CACHE_TTL = 300
+
+
+def cached_json(key, ttl, build):
+    payload = r.get(key)
+    if payload is None:
+        payload = orjson.dumps(build())
+        r.setex(key, ttl, payload)
+    return Response(payload, mimetype='application/json')
+
+
+# ============== STREAMED LISTINGS ==============
+def stream_json_array(stmt, serialize, chunk_size=500):
+    """Stream stmt's rows as a JSON array, chunk_size rows at a time.
+
+    Only one chunk of ORM objects is alive at once, and the first bytes go
+    out before the last rows are read. The query and the first chunk run
+    before the response is returned, so errors there still reach the
+    caller's except. An error in a later chunk can't change the status
+    (200 is already sent): it is logged and the connection is dropped,
+    leaving the client with a truncated, invalid JSON body.
+    """
+    stmt = stmt.execution_options(yield_per=chunk_size)
+    chunks = db.session.execute(stmt).scalars().partitions()
+    head = b','.join(orjson.dumps(serialize(row)) for row in next(chunks, []))
+    
+    def generate():
+        yield b'[' + head
+        try:
+            for chunk in chunks:
+                yield b','
+                yield b','.join(orjson.dumps(serialize(row)) for row in chunk)
+        except Exception:
+            app.logger.exception("Streaming JSON response failed mid-way")
+            raise
+        yield b']'
+    
+    return Response(stream_with_context(generate()), mimetype='application/json')
+
 
 # ============== AUTH DECORATOR ==============
 def token_required(f):
@@ -51,14 +273,12 @@ def token_required(f):
         if not token:
             return jsonify({"error": "Token is missing"}), 401
         
-        # Check if token is valid
-        if token not in active_tokens:
+        # Check if token is valid and get user_id from it
+        uid = r.get(f"sess:user:{token}")
+        if uid is None:
             return jsonify({"error": "Invalid or expired token"}), 401
         
-        # Get user_id from token
-        current_user_id = active_tokens[token]
-        
-        return f(current_user_id, *args, **kwargs)
+        return f(int(uid), *args, **kwargs)
     
     return decorated
 
@@ -80,14 +300,12 @@ def admin_required(f):
         if not token:
             return jsonify({"error": "Token is missing"}), 401
         
-        # Check if token is valid admin token
-        if token not in admin_tokens:
+        # Check if token is valid admin token and get admin_id from it
+        admin_id = r.get(f"sess:admin:{token}")
+        if admin_id is None:
             return jsonify({"error": "Invalid or expired admin token"}), 401
         
-        # Get admin_id from token
-        current_admin_id = admin_tokens[token]
-        
-        return f(current_admin_id, *args, **kwargs)
+        return f(int(admin_id), *args, **kwargs)
     
     return decorated
 
@@ -108,7 +326,7 @@ def register():
             return jsonify({"error": "Email already registered"}), 400
         
         # Create new user
-        hashed_password = generate_password_hash(password)
+        hashed_password = hash_password(password)
         new_user = User(email=email, password=hashed_password)
         
         db.session.add(new_user)
@@ -132,12 +350,12 @@ def login():
         
         user = User.query.filter_by(email=email).first()
         
-        if not user or not check_password_hash(user.password, password):
+        if not user or not verify_password(user, password):
             return jsonify({"error": "Invalid credentials"}), 401
         
         # Generate a random token
         token = secrets.token_urlsafe(32)
-        active_tokens[token] = user.id
+        r.setex(f"sess:user:{token}", TOKEN_TTL, user.id)
         
         return jsonify({
             "token": token,
@@ -175,8 +393,7 @@ def get_current_user(current_user_id):
 def logout(current_user_id):
     try:
         token = request.headers['Authorization'].split(" ")[1]
-        if token in active_tokens:
-            del active_tokens[token]
+        r.delete(f"sess:user:{token}")
         return jsonify({"message": "Logged out successfully"}), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 400
@@ -195,12 +412,12 @@ def admin_login():
         
         admin = Admin.query.filter_by(email=email).first()
         
-        if not admin or not check_password_hash(admin.password, password):
+        if not admin or not verify_password(admin, password):
             return jsonify({"error": "Invalid admin credentials"}), 401
         
         # Generate a random token
         token = secrets.token_urlsafe(32)
-        admin_tokens[token] = admin.id
+        r.setex(f"sess:admin:{token}", TOKEN_TTL, admin.id)
         
         return jsonify({
             "token": token,
@@ -240,8 +457,7 @@ def get_current_admin(current_admin_id):
 def admin_logout(current_admin_id):
     try:
         token = request.headers['Authorization'].split(" ")[1]
-        if token in admin_tokens:
-            del admin_tokens[token]
+        r.delete(f"sess:admin:{token}")
         return jsonify({"message": "Admin logged out successfully"}), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 400
@@ -254,42 +470,18 @@ def predict(current_user_id):
     try:
         data = request.json
 
-        # Convert Yes/No → 1/0
-        def yn(x):
-            return 1 if str(x).lower() == "yes" else 0
-
-        input_data = [
-            float(data["area"]),
-            int(data["bedrooms"]),
-            int(data["bathrooms"]),
-            int(data["stories"]),
-
-            yn(data["mainroad"]),
-            yn(data["guestroom"]),
-            yn(data["basement"]),
-            yn(data["hotwaterheating"]),
-            yn(data["airconditioning"]),
+        buf = _input_buffer()
+        values = build_features(data, buf)
 
-            int(data["parking"]),
-
-            yn(data["prefarea"]),
-
-            # Furnishing status encoding
-            label_encoders["furnishingstatus"].transform(
-                [data["furnishingstatus"]]
-            )[0]
-        ]
-
-        arr = np.array(input_data).reshape(1, -1)
-        price = model.predict(arr)[0]
+        price = predict_price(buf)
         price = round(float(price), 2)
 
         # Save prediction to database
         prediction = Prediction(
             user_id=current_user_id,
-            input_data=json.dumps(data),
             price=price,
-            favorite=False
+            favorite=False,
+            **values
         )
         db.session.add(prediction)
         db.session.commit()
@@ -310,19 +502,19 @@ def predict(current_user_id):
 @token_required
 def get_history(current_user_id):
     try:
-        predictions = Prediction.query.filter_by(user_id=current_user_id).order_by(Prediction.created_at.desc()).all()
-        
-        history = []
-        for pred in predictions:
-            history.append({
-                "id": pred.id,
-                "input": json.loads(pred.input_data),
-                "price": pred.price,
-                "favorite": pred.favorite,
-                "created_at": pred.created_at.isoformat()
-            })
+        stmt = (
+            select(Prediction)
+            .where(Prediction.user_id == current_user_id)
+            .order_by(Prediction.created_at.desc())
+        )
         
-        return jsonify(history), 200
+        return stream_json_array(stmt, lambda pred: {
+            "id": pred.id,
+            "input": pred.to_input(),
+            "price": pred.price,
+            "favorite": pred.favorite,
+            "created_at": pred.created_at.isoformat()
+        }), 200
     
     except Exception as e:
         return jsonify({"error": str(e)}), 400
@@ -375,10 +567,15 @@ def toggle_favorite(current_user_id, id):
 def get_all_users(current_admin_id):
     try:
         users = User.query.all()
+        counts = dict(
+            db.session.query(Prediction.user_id, func.count(Prediction.id))
+            .group_by(Prediction.user_id)
+            .all()
+        )
         user_list = []
         
         for user in users:
-            prediction_count = Prediction.query.filter_by(user_id=user.id).count()
+            prediction_count = counts.get(user.id, 0)
             user_list.append({
                 "id": user.id,
                 "email": user.email,
@@ -437,22 +634,21 @@ def toggle_block_user(current_admin_id, user_id):
 @admin_required
 def get_all_predictions(current_admin_id):
     try:
-        predictions = Prediction.query.order_by(Prediction.created_at.desc()).all()
-        prediction_list = []
-        
-        for pred in predictions:
-            user = User.query.get(pred.user_id)
-            prediction_list.append({
-                "id": pred.id,
-                "user_email": user.email if user else "Unknown",
-                "user_id": pred.user_id,
-                "input": json.loads(pred.input_data),
-                "price": pred.price,
-                "favorite": pred.favorite,
-                "created_at": pred.created_at.isoformat()
-            })
+        stmt = (
+            select(Prediction)
+            .options(joinedload(Prediction.user))
+            .order_by(Prediction.created_at.desc())
+        )
         
-        return jsonify(prediction_list), 200
+        return stream_json_array(stmt, lambda pred: {
+            "id": pred.id,
+            "user_email": pred.user.email if pred.user else "Unknown",
+            "user_id": pred.user_id,
+            "input": pred.to_input(),
+            "price": pred.price,
+            "favorite": pred.favorite,
+            "created_at": pred.created_at.isoformat()
+        }), 200
     
     except Exception as e:
         return jsonify({"error": str(e)}), 400
@@ -481,55 +677,63 @@ def delete_prediction_admin(current_admin_id, prediction_id):
 @admin_required
 def get_statistics(current_admin_id):
     try:
-        total_users = User.query.count()
-        total_predictions = Prediction.query.count()
-        
-        # Calculate average price
-        predictions = Prediction.query.all()
-        avg_price = sum([p.price for p in predictions]) / len(predictions) if predictions else 0
-        
-        # Get recent activity
-        recent_users = User.query.order_by(User.created_at.desc()).limit(5).all()
-        recent_predictions = Prediction.query.order_by(Prediction.created_at.desc()).limit(5).all()
-        
-        # Price range
-        max_price = max([p.price for p in predictions]) if predictions else 0
-        min_price = min([p.price for p in predictions]) if predictions else 0
-        
-        return jsonify({
-            "total_users": total_users,
-            "total_predictions": total_predictions,
-            "avg_price": round(avg_price, 2),
-            "max_price": round(max_price, 2),
-            "min_price": round(min_price, 2),
-            "recent_users_count": len(recent_users),
-            "recent_predictions_count": len(recent_predictions)
-        }), 200
+        return cached_json('admin:stats', STATS_CACHE_TTL, _build_statistics), 200
     
     except Exception as e:
         return jsonify({"error": str(e)}), 400
 
 
+def _build_statistics():
+    # User count plus prediction count, average and price range in a
+    # single statement (one pass over the prediction table)
+    total_users, total_predictions, avg_price, max_price, min_price = db.session.execute(
+        select(
+            select(func.count(User.id)).scalar_subquery(),
+            func.count(Prediction.id),
+            func.avg(Prediction.price),
+            func.max(Prediction.price),
+            func.min(Prediction.price)
+        ).select_from(Prediction)
+    ).one()
+    avg_price = avg_price or 0
+    max_price = max_price or 0
+    min_price = min_price or 0
+    
+    return {
+        "total_users": total_users,
+        "total_predictions": total_predictions,
+        "avg_price": round(avg_price, 2),
+        "max_price": round(max_price, 2),
+        "min_price": round(min_price, 2),
+        # "Recent activity" is the latest five of each, so these are just
+        # the totals capped at 5
+        "recent_users_count": min(total_users, 5),
+        "recent_predictions_count": min(total_predictions, 5)
+    }
+
+
 # D. MODEL INFO
 @app.route('/admin/model-info', methods=['GET'])
 @admin_required
 def get_model_info(current_admin_id):
     try:
-        model_info = {
-            "model_type": str(type(model).__name__),
-            "features_count": len(feature_names),
-            "feature_names": feature_names.tolist() if hasattr(feature_names, 'tolist') else list(feature_names),
-            "last_trained": "2024-01-15",  # You can store this in a config file
-            "accuracy": "85.3%",  # You can calculate this from your training data
-            "total_predictions": Prediction.query.count()
-        }
-        
-        return jsonify(model_info), 200
+        return cached_json('admin:model-info', MODEL_INFO_CACHE_TTL, _build_model_info), 200
     
     except Exception as e:
         return jsonify({"error": str(e)}), 400
 
 
+def _build_model_info():
+    return {
+        "model_type": str(type(model).__name__),
+        "features_count": len(feature_names),
+        "feature_names": feature_names.tolist() if hasattr(feature_names, 'tolist') else list(feature_names),
+        "last_trained": "2024-01-15",  # You can store this in a config file
+        "accuracy": "85.3%",  # You can calculate this from your training data
+        "total_predictions": Prediction.query.count()
+    }
+
+
 @app.route('/')
 def home():
     return "Flat Price Prediction API Running"
@@ -0,0 +1,57 @@
+"""
+Label encoder backed by pandas categoricals.
+
+Drop-in replacement for sklearn's LabelEncoder in the saved
+label_encoders.pkl: same sorted classes_, same codes, same
+transform/inverse_transform, but fitted with pandas' hash-based
+factorization instead of np.unique + searchsorted.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+class CategoryEncoder:
+    """
+    Map category labels to integer codes and back.
+
+    Attributes:
+        classes_: Sorted array of the labels seen during fit (must be
+            sorted when passed in directly)
+    """
+
+    def __init__(self, classes=None):
+        self.classes_ = None if classes is None else np.asarray(classes)
+
+    def fit(self, values):
+        self.fit_transform(values)
+        return self
+
+    def fit_transform(self, values):
+        cat = pd.Categorical(values)
+        self.classes_ = cat.categories.to_numpy()
+        return cat.codes.astype(np.int32)
+
+    def transform(self, values):
+        values = np.asarray(values, dtype=object if self.classes_.dtype == object else None)
+        missing = pd.isna(values)
+        try:
+            # classes_ is sorted, so one vectorised binary search finds every
+            # code; a label is known only if it sits at the position found
+            probe = np.where(missing, self.classes_[0], values).astype(self.classes_.dtype)
+            codes = np.searchsorted(self.classes_, probe)
+            known = ~missing & (codes < len(self.classes_))
+            known[known] = self.classes_[codes[known]] == values[known]
+        except (TypeError, ValueError):
+            # Labels that don't convert to or compare with classes_ (e.g.
+            # strings against numeric classes): match them by equality
+            # instead, so they are reported as unseen like LabelEncoder does
+            codes = pd.Index(self.classes_).get_indexer(values.astype(object))
+            known = ~missing & (codes >= 0)
+        if not known.all():
+            unseen = pd.unique(values[~known].astype(object))
+            raise ValueError(f"y contains previously unseen labels: {unseen.tolist()}")
+        return codes.astype(np.int32)
+
+    def inverse_transform(self, codes):
+        return self.classes_[np.asarray(codes)]
@@ -1,6 +1,5 @@
-from app import app, db
+from app import app, db, hash_password
 from models import Admin
-from werkzeug.security import generate_password_hash
 
 # Default admin credentials
 ADMIN_EMAIL = "admin@flatprice.com"
@@ -17,7 +16,7 @@ with app.app_context():
         print(f"⚠️  Admin already exists: {ADMIN_EMAIL}")
     else:
         # Create new admin
-        hashed_password = generate_password_hash(ADMIN_PASSWORD)
+        hashed_password = hash_password(ADMIN_PASSWORD)
         admin = Admin(
             email=ADMIN_EMAIL,
             password=hashed_password,
@@ -50,49 +50,71 @@ if not os.path.exists(test_file):
     train_data = train_data.dropna(subset=['area'])
     
     # Generate 100,000 synthetic samples
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     n_samples = 100000
     
     print(f"   Using training data statistics from {len(train_data)} clean samples")
     
-    # Generate synthetic features based on training data statistics
-    test_data = pd.DataFrame()
+    # Generate each synthetic column as a NumPy array and build the
+    # DataFrame once at the end instead of assigning column by column
+    yes_no = np.array(['yes', 'no'])
     
-    # Area - use normal distribution based on training data
-    test_data['area'] = np.random.normal(
-        train_data['area'].mean(),
-        train_data['area'].std(),
-        n_samples
-    ).astype(int).clip(
-        train_data['area'].min(),
-        train_data['area'].max()
-    )
+    def yn(p_yes):
+        return yes_no[(rng.random(n_samples) >= p_yes).astype(np.int8)]
     
-    # Discrete numerical features
-    test_data['bedrooms'] = np.random.choice([2, 3, 4, 5], n_samples, p=[0.25, 0.35, 0.30, 0.10])
-    test_data['bathrooms'] = np.random.choice([1, 2, 3, 4], n_samples, p=[0.25, 0.45, 0.20, 0.10])
-    test_data['stories'] = np.random.choice([1, 2, 3, 4], n_samples, p=[0.30, 0.40, 0.20, 0.10])
-    test_data['parking'] = np.random.choice([0, 1, 2, 3], n_samples, p=[0.10, 0.25, 0.50, 0.15])
-    
-    # Binary categorical features
-    test_data['mainroad'] = np.random.choice(['yes', 'no'], n_samples, p=[0.85, 0.15])
-    test_data['guestroom'] = np.random.choice(['yes', 'no'], n_samples, p=[0.30, 0.70])
-    test_data['basement'] = np.random.choice(['yes', 'no'], n_samples, p=[0.45, 0.55])
-    test_data['hotwaterheating'] = np.random.choice(['yes', 'no'], n_samples, p=[0.10, 0.90])
-    test_data['airconditioning'] = np.random.choice(['yes', 'no'], n_samples, p=[0.65, 0.35])
-    test_data['prefarea'] = np.random.choice(['yes', 'no'], n_samples, p=[0.50, 0.50])
-    test_data['furnishingstatus'] = np.random.choice(
-        ['furnished', 'semi-furnished', 'unfurnished'], 
-        n_samples, 
-        p=[0.45, 0.40, 0.15]
-    )
+    test_data = pd.DataFrame({
+        # Area - use normal distribution based on training data
+        'area': rng.normal(
+            train_data['area'].mean(),
+            train_data['area'].std(),
+            n_samples
+        ).astype(int).clip(
+            train_data['area'].min(),
+            train_data['area'].max()
+        ),
+        
+        # Discrete numerical features
+        'bedrooms': rng.choice([2, 3, 4, 5], n_samples, p=[0.25, 0.35, 0.30, 0.10]),
+        'bathrooms': rng.choice([1, 2, 3, 4], n_samples, p=[0.25, 0.45, 0.20, 0.10]),
+        'stories': rng.choice([1, 2, 3, 4], n_samples, p=[0.30, 0.40, 0.20, 0.10]),
+        'parking': rng.choice([0, 1, 2, 3], n_samples, p=[0.10, 0.25, 0.50, 0.15]),
+        
+        # Binary categorical features
+        'mainroad': yn(0.85),
+        'guestroom': yn(0.30),
+        'basement': yn(0.45),
+        'hotwaterheating': yn(0.10),
+        'airconditioning': yn(0.65),
+        'prefarea': yn(0.50),
+        'furnishingstatus': rng.choice(
+            ['furnished', 'semi-furnished', 'unfurnished'],
+            n_samples,
+            p=[0.45, 0.40, 0.15]
+        )
+    })
     
     print(f"✓ Generated {n_samples} synthetic test samples")
     print(f"⚠️  Note: This is SYNTHETIC data. Replace with real test.csv from Kaggle!")
     
 else:
     print(f"\n[1/6] Loading test data from: {test_file}")
-    test_data = pd.read_csv(test_file)
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pv
+        
+        # Multi-threaded parse with the numeric column types given up front
+        column_types = {
+            'area': pa.float32(),
+            'bedrooms': pa.int32(),
+            'bathrooms': pa.int32(),
+            'stories': pa.int32(),
+            'parking': pa.int32()
+        }
+        tbl = pv.read_csv(test_file, convert_options=pv.ConvertOptions(column_types=column_types))
+        test_data = tbl.to_pandas()
+    except (ImportError, ValueError):
+        # pyarrow missing, or a column didn't fit the declared types
+        test_data = pd.read_csv(test_file)
     print(f"✓ Test data loaded: {len(test_data)} samples")
 
 print(f"\n[2/6] Test data shape: {test_data.shape}")
@@ -128,11 +150,10 @@ test_processed = test_data.copy()
 # Encode categorical features
 for col, encoder in encoders.items():
     if col in test_processed.columns:
-        # Handle unseen categories
-        test_processed[col] = test_processed[col].apply(
-            lambda x: x if x in encoder.classes_ else encoder.classes_[0]
-        )
-        test_processed[col] = encoder.transform(test_processed[col])
+        # One hash lookup per value; unseen categories fall back to code 0
+        # (the encoding of encoder.classes_[0])
+        mapping = {v: i for i, v in enumerate(encoder.classes_)}
+        test_processed[col] = test_processed[col].map(mapping).fillna(0).astype(np.int32)
 
 # Ensure correct feature order
 if not all(col in test_processed.columns for col in feature_names):
@@ -141,7 +162,14 @@ if not all(col in test_processed.columns for col in feature_names):
     print(f"Found: {list(test_processed.columns)}")
     exit(1)
 
-X_test = test_processed[feature_names]
+# Contiguous float32 is what the forest predicts on; converting once here
+# avoids sklearn making its own float32 copy of the float64 frame. Keep it
+# a DataFrame so the pipeline still sees the feature names it was fitted on
+X_test = pd.DataFrame(
+    np.ascontiguousarray(test_processed[feature_names].to_numpy(dtype=np.float32)),
+    columns=feature_names,
+    copy=False
+)
 print(f"✓ Test data preprocessed: {X_test.shape}")
 
 # Generate predictions
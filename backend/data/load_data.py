@@ -8,50 +8,224 @@ This module handles:
 - Basic data validation
 """
 
+import numpy as np
 import pandas as pd
+from pandas.api.types import (
+    is_bool_dtype, is_numeric_dtype, is_object_dtype, is_string_dtype
+)
 import joblib
+from joblib import Parallel, delayed
+import functools
+import json
 import os
 import sys
-from sklearn.preprocessing import LabelEncoder
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pv
+except ImportError:
+    pa = None
 from sklearn.model_selection import train_test_split
 
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from category_encoder import CategoryEncoder
+
+
+def read_csv_fast(file_path, use_arrow=True):
+    """
+    Read a CSV with pyarrow's multithreaded reader, falling back to pandas.
+    
+    Args:
+        file_path: Path to the CSV file
+        use_arrow: Whether to try the pyarrow reader first
+        
+    Returns:
+        pandas DataFrame with numpy-backed columns
+    """
+    if use_arrow and pa is not None:
+        read_options = pv.ReadOptions(use_threads=True, block_size=8 << 20)
+        # Empty/NA string fields become missing, as with pd.read_csv, rather
+        # than '' (which the encoders would learn as a real class)
+        convert_options = pv.ConvertOptions(strings_can_be_null=True)
+        return pv.read_csv(file_path, read_options=read_options,
+                           convert_options=convert_options).to_pandas()
+    
+    return pd.read_csv(file_path)
+
+
+def read_csv_deduped(file_path, chunksize=1_000_000):
+    """
+    Read a CSV in chunks, dropping duplicate rows as they stream in.
+    
+    Rows are compared by their 64-bit pandas row hash, so only the hashes of
+    rows already kept are held across chunks rather than the rows themselves.
+    Chunks are parsed as text so a row hashes the same whichever chunk it
+    lands in; numeric columns are converted once after the concat.
+    
+    Args:
+        file_path: Path to the CSV file
+        chunksize: Number of rows parsed per chunk
+        
+    Returns:
+        tuple: (deduplicated DataFrame, number of rows read)
+    """
+    chunks = []
+    seen = np.empty(0, dtype=np.uint64)
+    rows_read = 0
+    
+    for chunk in pd.read_csv(file_path, chunksize=chunksize, dtype=str):
+        rows_read += len(chunk)
+        h = pd.util.hash_pandas_object(chunk, index=False).to_numpy()
+        keep = ~(pd.Series(h).duplicated().to_numpy() | np.isin(h, seen))
+        seen = np.concatenate([seen, h[keep]])
+        chunks.append(chunk[keep])
+    
+    if not chunks:
+        return pd.read_csv(file_path, nrows=0), 0
+    
+    df = pd.concat(chunks, ignore_index=True)
+    for col in df.columns:
+        try:
+            df[col] = pd.to_numeric(df[col])
+        except (ValueError, TypeError):
+            pass
+    return df, rows_read
+
+
+def drop_duplicate_rows(df):
+    """
+    Drop duplicate rows by comparing 64-bit row hashes.
+    
+    Each row is hashed once (vectorised), so duplicates are found with a
+    single pass over one uint64 array instead of column-by-column compares.
+    Keeps the first occurrence, like drop_duplicates().
+    
+    Args:
+        df: pandas DataFrame
+        
+    Returns:
+        DataFrame: Deduplicated frame with a fresh RangeIndex
+    """
+    h = pd.util.hash_pandas_object(df, index=False)
+    return df.loc[~h.duplicated().to_numpy()].reset_index(drop=True)
+
+
+def _partition_dtypes(df):
+    """
+    Split columns into numeric and categorical in a single pass over dtypes.
+    
+    Args:
+        df: pandas DataFrame
+        
+    Returns:
+        tuple: (numeric_columns, categorical_columns) as pandas Index objects
+    """
+    dtypes = df.dtypes.tolist()
+    num_mask = np.array([is_numeric_dtype(d) and not is_bool_dtype(d) for d in dtypes], dtype=bool)
+    cat_mask = np.array([is_object_dtype(d) or is_string_dtype(d) or isinstance(d, pd.CategoricalDtype)
+                         for d in dtypes], dtype=bool)
+    return df.columns[num_mask], df.columns[cat_mask]
+
+
+def _null_counts(df):
+    """
+    Count missing values per column from a single isna() mask.
+    
+    Args:
+        df: pandas DataFrame
+        
+    Returns:
+        pandas Series: Missing value count per column
+    """
+    return pd.Series(df.isna().to_numpy().sum(axis=0), index=df.columns)
+
 
-def load_and_clean_data(file_path="../data/housing_data.csv"):
+def downcast_numeric(df, exclude=()):
+    """
+    Shrink int64/float64 columns in place to the smallest dtype that holds
+    their values (int64 -> smallest int, float64 -> float32).
+    
+    Shared by preprocess.py and utils/preprocess.py so every pipeline
+    narrows its columns the same way.
+    
+    Args:
+        df: pandas DataFrame
+        exclude: Columns to leave as they are (e.g. the target)
+        
+    Returns:
+        DataFrame: df, with narrowed numeric dtypes
+    """
+    for col in df.select_dtypes(include=['int64', 'float64']).columns.difference(exclude, sort=False):
+        kind = 'integer' if df[col].dtype.kind == 'i' else 'float'
+        df[col] = pd.to_numeric(df[col], downcast=kind)
+    return df
+
+
+@functools.lru_cache(maxsize=None)
+def _ensure_dir(path):
+    """
+    Create a directory (once per process) if it doesn't exist.
+    
+    Args:
+        path: Directory path; an empty path means the current directory
+    """
+    if path:
+        os.makedirs(path, exist_ok=True)
+
+
+def load_and_clean_data(file_path="../data/housing_data.csv", use_arrow=True, chunksize=None):
     """
     Load dataset and perform basic cleaning operations.
     
     Args:
         file_path: Path to the housing data CSV file
+        use_arrow: Whether to parse the CSV with pyarrow when available
+        chunksize: If set, stream the CSV in chunks of this many rows and
+            deduplicate while reading (for files larger than memory)
         
     Returns:
         pandas DataFrame: Cleaned dataset
     """
     print(f"Loading dataset from: {file_path}")
     
-    # Load dataset
-    df = pd.read_csv(file_path)
-    
-    print(f"Original dataset shape: {df.shape}")
-    print(f"Original columns: {df.columns.tolist()}")
-    
-    # Remove duplicates
-    original_rows = len(df)
-    df = df.drop_duplicates()
+    if chunksize:
+        # Load and remove duplicates chunk by chunk
+        df, original_rows = read_csv_deduped(file_path, chunksize=chunksize)
+        print(f"Original dataset shape: {(original_rows, df.shape[1])}")
+        print(f"Original columns: {df.columns.tolist()}")
+    else:
+        # Load dataset
+        df = read_csv_fast(file_path, use_arrow=use_arrow)
+        
+        print(f"Original dataset shape: {df.shape}")
+        print(f"Original columns: {df.columns.tolist()}")
+        
+        # Remove duplicates
+        original_rows = len(df)
+        df = drop_duplicate_rows(df)
     duplicates_removed = original_rows - len(df)
     print(f"Duplicates removed: {duplicates_removed}")
     
+    # Store text columns as packed Arrow strings rather than Python objects
+    if pa is not None:
+        obj_cols = [col for col, dtype in df.dtypes.items() if is_object_dtype(dtype)]
+        if obj_cols:
+            df = df.astype({col: pd.StringDtype("pyarrow") for col in obj_cols})
+    
     # Fill missing numeric values with median
-    num_cols = df.select_dtypes(include=['int64', 'float64']).columns
+    num_cols, _ = _partition_dtypes(df)
+    
+    # One NaN mask and one nanmedian over the whole numeric block instead
+    # of isna/median/fillna per column
+    arr = df[num_cols].to_numpy(dtype=np.float64)
+    missing_counts = np.isnan(arr).sum(axis=0)
+    missing_info = {col: int(n) for col, n in zip(num_cols, missing_counts) if n > 0}
     
-    missing_info = {}
-    for col in num_cols:
-        missing_count = df[col].isna().sum()
-        if missing_count > 0:
-            missing_info[col] = missing_count
-            df[col].fillna(df[col].median(), inplace=True)
+    if missing_info:
+        medians = np.nanmedian(arr, axis=0)
+        df = df.fillna({col: med for col, med, n in zip(num_cols, medians, missing_counts) if n > 0})
     
     if missing_info:
         print("\nMissing values filled (with median):")
@@ -65,36 +239,49 @@ def load_and_clean_data(file_path="../data/housing_data.csv"):
     return df
 
 
-def get_data_info(df):
+def get_data_info(df, partition=None, null_counts=None):
     """
     Get comprehensive information about the dataset.
     
     Args:
         df: pandas DataFrame
+        partition: Optional (numeric_columns, categorical_columns) from _partition_dtypes
+        null_counts: Optional per-column missing counts from _null_counts
         
     Returns:
         dict: Dictionary containing data information
     """
+    num_cols, cat_cols = partition if partition is not None else _partition_dtypes(df)
+    
+    # Arrow-backed columns report their buffer sizes directly; only
+    # Python-object columns need the per-element deep walk
+    deep = any(is_object_dtype(dtype) for dtype in df.dtypes)
+    
     info = {
         'shape': df.shape,
         'columns': df.columns.tolist(),
         'dtypes': df.dtypes.to_dict(),
-        'missing_values': df.isnull().sum().to_dict(),
-        'numeric_columns': df.select_dtypes(include=['int64', 'float64']).columns.tolist(),
-        'categorical_columns': df.select_dtypes(include=['object', 'category']).columns.tolist(),
-        'memory_usage': df.memory_usage(deep=True).sum() / 1024**2  # MB
+        'missing_values': (null_counts if null_counts is not None else _null_counts(df)).to_dict(),
+        'numeric_columns': num_cols.tolist(),
+        'categorical_columns': cat_cols.tolist(),
+        'memory_usage': df.memory_usage(deep=deep).sum() / 1024**2  # MB
     }
     
     return info
 
 
-def display_data_summary(df):
+def display_data_summary(df, partition=None, null_counts=None, quartiles=False):
     """
     Display a comprehensive summary of the dataset.
     
     Args:
         df: pandas DataFrame
+        partition: Optional (numeric_columns, categorical_columns) from _partition_dtypes
+        null_counts: Optional per-column missing counts from _null_counts
+        quartiles: Whether to also compute the 25/50/75% quantiles
     """
+    num_cols, categorical_cols = partition if partition is not None else _partition_dtypes(df)
+    
     print("\n" + "="*60)
     print("DATASET SUMMARY")
     print("="*60)
@@ -108,7 +295,7 @@ def display_data_summary(df):
     print(df.dtypes)
     
     print("\nMissing Values:")
-    missing = df.isnull().sum()
+    missing = null_counts if null_counts is not None else _null_counts(df)
     missing_pct = 100 * missing / len(df)
     missing_df = pd.DataFrame({
         'Missing Count': missing,
@@ -117,9 +304,14 @@ def display_data_summary(df):
     print(missing_df[missing_df['Missing Count'] > 0])
     
     print("\nNumerical Columns Summary:")
-    print(df.describe())
+    # Moments and extremes are single passes; quantiles need a partition of
+    # every column, so they are only computed (in one batch) on request
+    num_df = df[num_cols]
+    summary = num_df.agg(['count', 'mean', 'std', 'min', 'max'])
+    if quartiles:
+        summary = pd.concat([summary, num_df.quantile([0.25, 0.5, 0.75]).rename(index=lambda q: f"{q:.0%}")])
+    print(summary)
     
-    categorical_cols = df.select_dtypes(include=['object', 'category']).columns
     if len(categorical_cols) > 0:
         print("\nCategorical Columns:")
         for col in categorical_cols:
@@ -127,14 +319,30 @@ def display_data_summary(df):
             print(df[col].value_counts().head(10))
 
 
-def encode_categorical_features(df, save_encoders=True, encoder_path="../model/label_encoders.pkl"):
+def _fit_encoder(values):
     """
-    Encode categorical features using LabelEncoder.
+    Fit a CategoryEncoder on one column.
+    
+    Args:
+        values: pandas Series of category labels
+        
+    Returns:
+        tuple: (fitted CategoryEncoder, int32 codes)
+    """
+    le = CategoryEncoder()
+    return le, le.fit_transform(values)
+
+
+def encode_categorical_features(df, save_encoders=True, encoder_path="../model/label_encoders.pkl",
+                                partition=None):
+    """
+    Encode categorical features as pandas categorical codes.
     
     Args:
         df: pandas DataFrame
         save_encoders: Whether to save the encoders to disk
         encoder_path: Path to save the label encoders
+        partition: Optional (numeric_columns, categorical_columns) from _partition_dtypes
         
     Returns:
         tuple: (encoded_df, encoders_dict)
@@ -143,36 +351,44 @@ def encode_categorical_features(df, save_encoders=True, encoder_path="../model/l
     print("ENCODING CATEGORICAL FEATURES")
     print("="*60)
     
-    # Create a copy to avoid modifying the original
-    df_encoded = df.copy()
-    
     # Get categorical columns
-    cat_cols = df_encoded.select_dtypes(include=['object']).columns
+    _, cat_cols = partition if partition is not None else _partition_dtypes(df)
     
     if len(cat_cols) == 0:
         print("\nNo categorical columns found to encode.")
-        return df_encoded, {}
+        return df, {}
     
     print(f"\nFound {len(cat_cols)} categorical columns: {cat_cols.tolist()}")
     
     encoders = {}
+    new_cols = {}
     
-    for col in cat_cols:
+    # Columns are independent and factorization runs in C, so fit them on a
+    # thread pool and only report sequentially
+    fitted = Parallel(n_jobs=-1, prefer="threads")(
+        delayed(_fit_encoder)(df[col]) for col in cat_cols
+    )
+    
+    for col, (le, codes) in zip(cat_cols, fitted):
         print(f"\nEncoding column: {col}")
-        unique_values = df_encoded[col].nunique()
-        print(f"  - Unique values: {unique_values}")
-        print(f"  - Sample values: {df_encoded[col].unique()[:5].tolist()}")
         
-        le = LabelEncoder()
-        df_encoded[col] = le.fit_transform(df_encoded[col])
+        new_cols[col] = codes
         encoders[col] = le
         
-        print(f"  - Encoded range: [{df_encoded[col].min()}, {df_encoded[col].max()}]")
+        # The fitted classes already give the distinct count, and the
+        # sample only needs the head of the column, not a full unique()
+        print(f"  - Unique values: {len(le.classes_)}")
+        print(f"  - Sample values: {df[col].iloc[:5].unique().tolist()}")
+        print(f"  - Encoded range: [{new_cols[col].min()}, {new_cols[col].max()}]")
+    
+    # Assemble the encoded frame once; the input frame is left untouched
+    # without copying it up front
+    df_encoded = df.assign(**new_cols)
     
     # Save encoders for Flask
     if save_encoders:
         # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(encoder_path), exist_ok=True)
+        _ensure_dir(os.path.dirname(encoder_path))
         
         joblib.dump(encoders, encoder_path)
         print(f"\n✓ Label encoders saved to: {encoder_path}")
@@ -188,18 +404,38 @@ def decode_categorical_features(df, encoders):
     
     Args:
         df: pandas DataFrame with encoded features
-        encoders: Dictionary of LabelEncoders
+        encoders: Dictionary of CategoryEncoders
         
     Returns:
         pandas DataFrame with decoded categorical features
     """
-    df_decoded = df.copy()
-    
-    for col, encoder in encoders.items():
-        if col in df_decoded.columns:
-            df_decoded[col] = encoder.inverse_transform(df_decoded[col].astype(int))
-    
-    return df_decoded
+    cols = [col for col in encoders if col in df.columns]
+    if not cols:
+        return df
+    
+    # Pack every column's classes into one flat array with per-column
+    # offsets, then decode all columns with a single gather
+    classes = [np.asarray(encoders[col].classes_, dtype=object) for col in cols]
+    offsets = np.cumsum([0] + [len(c) for c in classes[:-1]])
+    cats_flat = np.concatenate(classes)
+    
+    codes = df[cols].to_numpy(dtype=np.int64)
+    
+    # The flat gather has no per-column bounds, so an out-of-range code
+    # would silently decode to a neighbouring column's class
+    sizes = np.array([len(c) for c in classes])
+    bad = (codes < -1) | (codes >= sizes)
+    if bad.any():
+        j = int(np.flatnonzero(bad.any(axis=0))[0])
+        raise ValueError(
+            f"Column '{cols[j]}' contains previously unseen labels: "
+            f"{np.unique(codes[bad[:, j], j]).tolist()}"
+        )
+    
+    values = cats_flat[codes + offsets]
+    values[codes < 0] = None  # -1 is the code for a missing label
+    
+    return df.assign(**{col: values[:, j] for j, col in enumerate(cols)})
 
 
 def load_encoders(encoder_path="../model/label_encoders.pkl"):
@@ -210,7 +446,7 @@ def load_encoders(encoder_path="../model/label_encoders.pkl"):
         encoder_path: Path to the saved encoders
         
     Returns:
-        dict: Dictionary of LabelEncoders
+        dict: Dictionary of CategoryEncoders
     """
     if not os.path.exists(encoder_path):
         print(f"❌ ERROR: Encoders not found at {encoder_path}")
@@ -265,7 +501,7 @@ def select_features_and_target(df, target_column="price", save_feature_names=Tru
     # Save feature names for Flask
     if save_feature_names:
         # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(feature_names_path), exist_ok=True)
+        _ensure_dir(os.path.dirname(feature_names_path))
         
         joblib.dump(X.columns.tolist(), feature_names_path)
         print(f"\n✓ Feature names saved to: {feature_names_path}")
@@ -296,7 +532,7 @@ def load_feature_names(feature_names_path="../model/feature_names.pkl"):
 
 
 def split_train_test(X, y, test_size=0.2, random_state=42, save_splits=True, 
-                     splits_path="../model/splits.pkl"):
+                     splits_path="../model/splits"):
     """
     Split data into training and testing sets.
     
@@ -306,7 +542,7 @@ def split_train_test(X, y, test_size=0.2, random_state=42, save_splits=True,
         test_size: Proportion of data for testing (default: 0.2 = 20%)
         random_state: Random state for reproducibility (default: 42)
         save_splits: Whether to save splits to disk
-        splits_path: Path to save the splits
+        splits_path: Path prefix for the split files and their .json manifest
         
     Returns:
         tuple: (X_train, X_test, y_train, y_test)
@@ -341,29 +577,70 @@ def split_train_test(X, y, test_size=0.2, random_state=42, save_splits=True,
     # Save splits
     if save_splits:
         # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(splits_path), exist_ok=True)
+        _ensure_dir(os.path.dirname(splits_path))
+        
+        # Narrow the feature dtypes once here so every consumer of the splits
+        # reads half the bytes; the target keeps full precision, since prices
+        # run past the range float32 holds exactly
+        X_train, X_test = downcast_numeric(X_train), downcast_numeric(X_test)
+        
+        # One .npy per array so each can be memory-mapped on load; the
+        # feature matrices are stored as float32, which is what the trees use
+        arrays = {
+            "X_train": X_train.to_numpy(dtype=np.float32),
+            "X_test": X_test.to_numpy(dtype=np.float32),
+            "y_train": y_train.to_numpy(),
+            "y_test": y_test.to_numpy(),
+        }
+        files = {name: f"{splits_path}.{name}.npy" for name in arrays}
+        for name, arr in arrays.items():
+            np.save(files[name], np.ascontiguousarray(arr))
         
-        joblib.dump((X_train, X_test, y_train, y_test), splits_path)
-        print(f"\n✓ Train/test splits saved to: {splits_path}")
+        manifest = {
+            "files": {k: os.path.basename(v) for k, v in files.items()},
+            "feature_columns": list(X_train.columns),
+            "target": y_train.name,
+            "train_rows": len(X_train),
+            "test_rows": len(X_test),
+        }
+        with open(f"{splits_path}.json", "w") as f:
+            json.dump(manifest, f, indent=2)
+        print(f"\n✓ Train/test splits saved to: {splits_path}.*.npy (+ {os.path.basename(splits_path)}.json)")
     
     return X_train, X_test, y_train, y_test
 
 
-def load_splits(splits_path="../model/splits.pkl"):
+def load_splits(splits_path="../model/splits", mmap_mode="r"):
     """
     Load saved train/test splits.
     
     Args:
-        splits_path: Path to the saved splits
+        splits_path: Path prefix the splits were saved under
+        mmap_mode: numpy memory-map mode for the arrays (None reads them into memory)
         
     Returns:
         tuple: (X_train, X_test, y_train, y_test)
     """
-    if not os.path.exists(splits_path):
+    manifest_path = f"{splits_path}.json"
+    if not os.path.exists(manifest_path):
         print(f"❌ ERROR: Splits not found at {splits_path}")
         return None, None, None, None
     
-    X_train, X_test, y_train, y_test = joblib.load(splits_path)
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+    base_dir = os.path.dirname(splits_path)
+    arrays = {
+        name: np.load(os.path.join(base_dir, fname), mmap_mode=mmap_mode)
+        for name, fname in manifest["files"].items()
+    }
+    
+    # Wrap the (possibly memory-mapped) arrays without copying them
+    columns = manifest["feature_columns"]
+    X_train = pd.DataFrame(arrays["X_train"], columns=columns, copy=False)
+    X_test = pd.DataFrame(arrays["X_test"], columns=columns, copy=False)
+    y_train = pd.Series(arrays["y_train"], name=manifest["target"], copy=False)
+    y_test = pd.Series(arrays["y_test"], name=manifest["target"], copy=False)
+    
     print(f"✓ Train/test splits loaded from: {splits_path}")
     print(f"  - Training samples: {len(X_train)}")
     print(f"  - Testing samples: {len(X_test)}")
@@ -371,28 +648,34 @@ def load_splits(splits_path="../model/splits.pkl"):
     return X_train, X_test, y_train, y_test
 
 
-def save_cleaned_data(df, output_path="../data/housing_data_cleaned.csv"):
+def save_cleaned_data(df, output_path="../data/housing_data_cleaned.csv", use_arrow=True):
     """
     Save the cleaned dataset to a CSV file.
     
     Args:
         df: pandas DataFrame
         output_path: Path to save the cleaned data
+        use_arrow: Whether to write the CSV with pyarrow when available
     """
     # Create directory if it doesn't exist
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    _ensure_dir(os.path.dirname(output_path))
     
-    df.to_csv(output_path, index=False)
+    if use_arrow and pa is not None:
+        pv.write_csv(pa.Table.from_pandas(df, preserve_index=False), output_path,
+                     write_options=pv.WriteOptions(quoting_header="none"))
+    else:
+        df.to_csv(output_path, index=False)
     print(f"\nCleaned data saved to: {output_path}")
 
 
-def validate_data(df, required_columns=None):
+def validate_data(df, required_columns=None, null_counts=None):
     """
     Validate the dataset for basic requirements.
     
     Args:
         df: pandas DataFrame
         required_columns: List of required column names
+        null_counts: Optional per-column missing counts from _null_counts
         
     Returns:
         bool: True if validation passes, False otherwise
@@ -421,15 +704,14 @@ def validate_data(df, required_columns=None):
     
     # Check for excessive missing values
     missing_threshold = 0.5  # 50%
-    high_missing = []
-    for col in df.columns:
-        missing_pct = df[col].isnull().sum() / len(df)
-        if missing_pct > missing_threshold:
-            high_missing.append((col, missing_pct))
+    if null_counts is None:
+        null_counts = _null_counts(df)
+    missing_pct = null_counts / len(df)
+    high_missing = missing_pct[missing_pct > missing_threshold]
     
-    if high_missing:
+    if len(high_missing) > 0:
         print(f"⚠ WARNING: Columns with >{missing_threshold*100}% missing values:")
-        for col, pct in high_missing:
+        for col, pct in high_missing.items():
             print(f"  - {col}: {pct*100:.2f}%")
     else:
         print(f"✓ No columns with excessive missing values")
@@ -454,14 +736,19 @@ if __name__ == "__main__":
     # Load and clean data
     df = load_and_clean_data(data_path)
     
+    # Partition columns by dtype and count missing values once for the
+    # steps below
+    partition = _partition_dtypes(df)
+    null_counts = _null_counts(df)
+    
     # Display summary
-    display_data_summary(df)
+    display_data_summary(df, partition, null_counts)
     
     # Validate data
-    validate_data(df)
+    validate_data(df, null_counts=null_counts)
     
     # Encode categorical features
-    df_encoded, encoders = encode_categorical_features(df)
+    df_encoded, encoders = encode_categorical_features(df, partition=partition)
     
     # Select features and target
     X, y = select_features_and_target(df_encoded, target_column="price")
@@ -480,7 +767,7 @@ if __name__ == "__main__":
         print(f"  ✓ Processed data: ../data/housing_data_processed.csv")
         print(f"  ✓ Label encoders: ../model/label_encoders.pkl")
         print(f"  ✓ Feature names: ../model/feature_names.pkl")
-        print(f"  ✓ Train/test splits: ../model/splits.pkl")
+        print(f"  ✓ Train/test splits: ../model/splits.*.npy (+ splits.json)")
         
         print(f"\n📊 Dataset ready for training:")
         print(f"  - Total samples: {len(df_encoded)}")
@@ -7,6 +7,9 @@ import pandas as pd
 import joblib
 import os
 import numpy as np
+from joblib import Parallel, delayed
+
+from preprocess import load_processed_splits
 
 # Setup paths
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -25,8 +28,9 @@ print(f"✓ Model loaded from: {model_path}")
 
 # Load the test split
 print("\n[2/5] Loading test data...")
-splits_path = os.path.join(MODEL_DIR, "splits.pkl")
-X_train, X_test, y_train, y_test = joblib.load(splits_path)
+# Same deterministic split that preprocess.py / train_model.py use, so the
+# model is scored on exactly the rows it was held out from
+X_train, X_test, y_train, y_test = load_processed_splits()
 print(f"✓ Test data loaded: {X_test.shape[0]} samples, {X_test.shape[1]} features")
 
 # Load feature names
@@ -37,34 +41,52 @@ print(f"✓ Features: {', '.join(feature_names)}")
 
 # Generate predictions
 print("\n[4/5] Generating predictions...")
-predictions = model.predict(X_test)
+# Impute once, then fan the trees out over threads; sklearn's tree predict
+# releases the GIL, so this scales with cores. Averaging the per-tree
+# outputs is exactly what RandomForestRegressor.predict does.
+X_test_imputed = np.ascontiguousarray(
+    model.named_steps["imputer"].transform(X_test), dtype=np.float32
+)
+trees = model.named_steps["model"].estimators_
+tree_preds = Parallel(n_jobs=-1, prefer="threads")(
+    delayed(tree.predict)(X_test_imputed, check_input=False) for tree in trees
+)
+predictions = np.mean(tree_preds, axis=0)
 print(f"✓ Generated {len(predictions)} predictions")
 print(f"  - Min prediction: ₹{predictions.min():,.0f}")
 print(f"  - Max prediction: ₹{predictions.max():,.0f}")
 print(f"  - Mean prediction: ₹{predictions.mean():,.0f}")
 print(f"  - Median prediction: ₹{np.median(predictions):,.0f}")
 
-# Create submission DataFrame
+# Create submission columns straight from the prediction array
 print("\n[5/5] Creating submission file...")
-submission_df = pd.DataFrame({
-    'index': range(len(predictions)),
-    'price': predictions.astype(int)
-})
+n = predictions.shape[0]
+submission = {
+    'index': np.arange(n, dtype=np.int32),
+    'price': predictions.astype(np.int32)
+}
 
-# Save to CSV
+# Save to CSV (pyarrow's writer when available, pandas otherwise)
 output_path = os.path.join(SCRIPT_DIR, "kaggle_submission.csv")
-submission_df.to_csv(output_path, index=False)
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pv
+
+    pv.write_csv(pa.table(submission), output_path,
+                 write_options=pv.WriteOptions(quoting_header="none"))
+except ImportError:
+    pd.DataFrame(submission).to_csv(output_path, index=False)
 
 print(f"✓ Submission file created: {output_path}")
 print(f"\n{'=' * 80}")
 print("SUBMISSION SUMMARY")
 print("=" * 80)
-print(f"Total predictions: {len(submission_df)}")
-print(f"Columns: {', '.join(submission_df.columns)}")
+print(f"Total predictions: {n}")
+print(f"Columns: {', '.join(submission)}")
 print(f"\nFirst 5 predictions:")
-print(submission_df.head())
+print(pd.DataFrame({k: v[:5] for k, v in submission.items()}))
 print(f"\nLast 5 predictions:")
-print(submission_df.tail())
+print(pd.DataFrame({k: v[-5:] for k, v in submission.items()}, index=np.arange(max(n - 5, 0), n)))
 
 # Model performance on test set (for reference)
 print(f"\n{'=' * 80}")
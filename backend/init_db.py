@@ -1,5 +1,67 @@
+import json
+from sqlalchemy import inspect, text
 from app import app, db
+from models import is_yes
+
+# Typed columns that replaced the prediction.input_data JSON blob
+PREDICTION_COLUMNS = {
+    'area': 'FLOAT',
+    'bedrooms': 'INTEGER',
+    'bathrooms': 'INTEGER',
+    'stories': 'INTEGER',
+    'mainroad': 'BOOLEAN',
+    'guestroom': 'BOOLEAN',
+    'basement': 'BOOLEAN',
+    'hotwaterheating': 'BOOLEAN',
+    'airconditioning': 'BOOLEAN',
+    'parking': 'INTEGER',
+    'prefarea': 'BOOLEAN',
+    'furnishingstatus': 'VARCHAR(20)'
+}
+
+YN_COLUMNS = ('mainroad', 'guestroom', 'basement', 'hotwaterheating', 'airconditioning', 'prefarea')
+
+
+def migrate_input_data():
+    """Split input_data into typed columns on databases created before them."""
+    existing = {c['name'] for c in inspect(db.engine).get_columns('prediction')}
+    if 'input_data' not in existing:
+        return
+
+    for name, sql_type in PREDICTION_COLUMNS.items():
+        if name not in existing:
+            db.session.execute(text(f"ALTER TABLE prediction ADD COLUMN {name} {sql_type}"))
+
+    rows = db.session.execute(text("SELECT id, input_data FROM prediction")).all()
+    for pred_id, input_data in rows:
+        data = json.loads(input_data or '{}')
+        values = {
+            'id': pred_id,
+            'area': float(data['area']) if 'area' in data else None,
+            'bedrooms': data.get('bedrooms'),
+            'bathrooms': data.get('bathrooms'),
+            'stories': data.get('stories'),
+            'parking': data.get('parking'),
+            'furnishingstatus': data.get('furnishingstatus')
+        }
+        for k in YN_COLUMNS:
+            values[k] = is_yes(str(data.get(k, '')))
+        db.session.execute(text(
+            "UPDATE prediction SET " +
+            ", ".join(f"{k} = :{k}" for k in PREDICTION_COLUMNS) +
+            " WHERE id = :id"
+        ), values)
+
+    db.session.execute(text("ALTER TABLE prediction DROP COLUMN input_data"))
+    print(f"✓ Migrated {len(rows)} predictions to typed columns")
+
 
 with app.app_context():
     db.create_all()
+    migrate_input_data()
+    # create_all() skips indexes on tables that already exist
+    db.session.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_pred_user_created ON prediction(user_id, created_at)"
+    ))
+    db.session.commit()
     print("✓ Database tables created successfully!")
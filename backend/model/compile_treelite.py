@@ -0,0 +1,50 @@
+import os
+import sys
+
+import joblib
+import numpy as np
+
+import treelite
+import tl2cgen
+
+# preprocess.py lives one level up, in backend/
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from preprocess import load_processed_splits
+
+print("Compiling Random Forest with Treelite...")
+print("================================================")
+
+# ----------------------------------------------------
+# 1. LOAD TRAINED PIPELINE
+# ----------------------------------------------------
+pipeline = joblib.load("random_forest_model.pkl")
+forest = pipeline.named_steps["model"]
+
+print("Trees:", len(forest.estimators_))
+
+# ----------------------------------------------------
+# 2. IMPORT FOREST AND COMPILE TO A SHARED LIBRARY
+# ----------------------------------------------------
+# Only the forest is compiled; the API always sends a fully populated
+# row, so the pipeline's median imputer has nothing to fill there.
+tl_model = treelite.sklearn.import_model(forest)
+tl2cgen.export_lib(
+    tl_model,
+    toolchain="gcc",
+    libpath="./random_forest_model.so",
+    params={"parallel_comp": 4}
+)
+
+# ----------------------------------------------------
+# 3. SANITY CHECK AGAINST SKLEARN
+# ----------------------------------------------------
+X_train, X_test, y_train, y_test = load_processed_splits()
+X = pipeline.named_steps["imputer"].transform(X_test).astype(np.float32)
+
+predictor = tl2cgen.Predictor("./random_forest_model.so")
+tl_pred = predictor.predict(tl2cgen.DMatrix(X)).reshape(-1)
+skl_pred = forest.predict(X)
+
+print("Max abs diff vs sklearn:", float(np.max(np.abs(tl_pred - skl_pred))))
+
+print("\nCompiled Model Saved Successfully ✅")
@@ -17,6 +17,36 @@ sns.set_style('whitegrid')
 plt.rcParams['figure.figsize'] = (12, 8)
 
 
+def save_correlation_heatmap(corr_matrix, path="correlation_heatmap.png", annotate_max=12):
+    """
+    Draw a correlation matrix as a single imshow image and save it.
+
+    Cell values are only written on matrices smaller than annotate_max,
+    where the text stays readable.
+    """
+    k = corr_matrix.shape[0]
+    values = corr_matrix.to_numpy()
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+    im = ax.imshow(values, cmap='coolwarm', vmin=-1, vmax=1)
+    ax.set_xticks(range(k))
+    ax.set_xticklabels(corr_matrix.columns, rotation=90)
+    ax.set_yticks(range(k))
+    ax.set_yticklabels(corr_matrix.columns)
+    ax.grid(False)
+
+    if k < annotate_max:
+        for i in range(k):
+            for j in range(k):
+                ax.text(j, i, f"{values[i, j]:.2f}", ha='center', va='center', fontsize=8)
+
+    fig.colorbar(im)
+    ax.set_title("Correlation Heatmap")
+    fig.tight_layout()
+    fig.savefig(path)
+    plt.close(fig)
+
+
 class FlatPriceEDA:
     """
     Exploratory Data Analysis class for flat price prediction dataset
@@ -79,25 +109,26 @@ class FlatPriceEDA:
         corr_matrix = self.df[self.numeric_cols].corr()
         print(corr_matrix)
 
-        plt.figure(figsize=(10, 6))
-        sns.heatmap(corr_matrix, annot=True, cmap='coolwarm')
-        plt.title("Correlation Heatmap")
-        plt.savefig("correlation_heatmap.png")
-        plt.close()
+        save_correlation_heatmap(corr_matrix)
 
         if target_column:
             print("\nCorrelation with target:")
             print(corr_matrix[target_column].sort_values(ascending=False))
 
-    def distribution_plots(self):
+    def distribution_plots(self, max_rows=50000, ncols=4):
         print("\n==== DISTRIBUTION PLOTS ====")
 
-        for col in self.numeric_cols:
-            plt.figure(figsize=(6, 4))
-            sns.histplot(self.df[col], bins=30)
-            plt.title(f"Distribution of {col}")
-            plt.savefig(f"{col}_distribution.png")
-            plt.close()
+        # One grid figure saved once; large frames are sampled, which keeps
+        # the histogram shapes but cuts binning and rendering time
+        df = self.df[self.numeric_cols]
+        if len(df) > max_rows:
+            df = df.sample(n=max_rows, random_state=42)
+
+        nrows = -(-len(self.numeric_cols) // ncols)
+        df.hist(bins=30, layout=(nrows, ncols), figsize=(4 * ncols, 3 * nrows))
+        plt.tight_layout()
+        plt.savefig("distributions.png")
+        plt.close('all')
 
     def run_full_eda(self, target_column=None):
         self.load_data()
@@ -129,8 +160,12 @@ def main():
     print("\nStatistical Summary:")
     print(df.describe())
 
+    # Compute the correlation matrix once for both the print and the heatmap
+    num_df = df.select_dtypes(include=[np.number])
+    corr = num_df.corr()
+
     print("\nCorrelation with Price:")
-    print(df.corr(numeric_only=True)["price"].sort_values(ascending=False))
+    print(corr["price"].sort_values(ascending=False))
 
     # Price distribution
     plt.figure(figsize=(8, 5))
@@ -140,11 +175,7 @@ def main():
     plt.close()
 
     # Correlation heatmap
-    plt.figure(figsize=(10, 6))
-    sns.heatmap(df.corr(numeric_only=True), annot=True)
-    plt.title("Correlation Heatmap")
-    plt.savefig("correlation_heatmap.png")
-    plt.close()
+    save_correlation_heatmap(corr)
 
     # OPTIONAL CLASS RUN
     DATA_PATH = "backend/data/housing_data.csv"
@@ -0,0 +1,57 @@
+import os
+import sys
+
+import joblib
+import numpy as np
+
+from skl2onnx import convert_sklearn
+from skl2onnx.common.data_types import FloatTensorType
+
+# preprocess.py lives one level up, in backend/
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from preprocess import load_processed_splits
+
+print("Exporting Random Forest to ONNX...")
+print("================================================")
+
+# ----------------------------------------------------
+# 1. LOAD TRAINED PIPELINE
+# ----------------------------------------------------
+pipeline = joblib.load("random_forest_model.pkl")
+feature_names = joblib.load("feature_names.pkl")
+
+print("Features:", len(feature_names))
+
+# ----------------------------------------------------
+# 2. CONVERT (IMPUTER + FOREST) TO ONNX
+# ----------------------------------------------------
+initial_type = [("input", FloatTensorType([None, len(feature_names)]))]
+onx = convert_sklearn(pipeline, initial_types=initial_type)
+
+# ----------------------------------------------------
+# 3. SAVE ONNX MODEL
+# ----------------------------------------------------
+with open("random_forest_model.onnx", "wb") as f:
+    f.write(onx.SerializeToString())
+
+# ----------------------------------------------------
+# 4. SANITY CHECK AGAINST SKLEARN
+# ----------------------------------------------------
+try:
+    import onnxruntime as ort
+
+    X_train, X_test, y_train, y_test = load_processed_splits()
+    X = np.asarray(X_test, dtype=np.float32)
+
+    sess = ort.InferenceSession("random_forest_model.onnx", providers=["CPUExecutionProvider"])
+    onnx_pred = sess.run(None, {"input": X})[0][:, 0]
+    skl_pred = pipeline.predict(X)
+
+    # ONNX Runtime's tree ensemble sums in float32, so expect a small drift
+    # (~1e-6 relative); app.py only serves this model when USE_ONNX=1
+    print("Max abs diff vs sklearn:", float(np.max(np.abs(onnx_pred - skl_pred))))
+    print("Max rel diff vs sklearn:", float(np.max(np.abs(onnx_pred - skl_pred) / np.abs(skl_pred))))
+except ImportError:
+    print("onnxruntime not installed, skipping sanity check")
+
+print("\nONNX Model Saved Successfully ✅")
@@ -1,3 +1,6 @@
+import os
+import sys
+
 import joblib
 import numpy as np
 import pandas as pd
@@ -9,13 +12,22 @@ from sklearn.pipeline import Pipeline
 
 import matplotlib.pyplot as plt
 
+# preprocess.py lives one level up, in backend/
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from preprocess import load_processed_splits
+
 print("Starting Random Forest Training...")
 print("================================================")
 
 # ----------------------------------------------------
 # 1. LOAD PREPROCESSED DATA
 # ----------------------------------------------------
-X_train, X_test, y_train, y_test = joblib.load("splits.pkl")
+# The split is recomputed deterministically from the processed dataset
+X_train, X_test, y_train, y_test = load_processed_splits()
+
+# float32 halves the memory traffic of split evaluation; trees use it natively
+X_train = X_train.astype(np.float32)
+X_test = X_test.astype(np.float32)
 
 print("Train Shape:", X_train.shape)
 print("Test Shape :", X_test.shape)
@@ -29,6 +41,8 @@ pipeline = Pipeline([
         n_estimators=120,
         max_depth=20,
         min_samples_split=2,
+        max_features="sqrt",
+        n_jobs=-1,
         random_state=42
     ))
 ])
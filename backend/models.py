@@ -3,13 +3,18 @@ from datetime import datetime
 
 db = SQLAlchemy()
 
+def is_yes(value):
+    """Read a Yes/No input field: true when it starts with 'y' or 'Y' ("" → False)."""
+    # A 1-char slice of a str is a cached singleton, so no new string is built
+    return value[:1] in ('y', 'Y')
+
 class User(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     email = db.Column(db.String(120), unique=True, nullable=False)
     password = db.Column(db.String(200), nullable=False)
     is_blocked = db.Column(db.Boolean, default=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    predictions = db.relationship('Prediction', backref='user', lazy=True, cascade='all, delete-orphan')
+    predictions = db.relationship('Prediction', back_populates='user', lazy=True, cascade='all, delete-orphan')
 
 class Admin(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -19,9 +24,45 @@ class Admin(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
 class Prediction(db.Model):
+    __table_args__ = (
+        db.Index('ix_pred_user_created', 'user_id', 'created_at'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'))
-    input_data = db.Column(db.Text)
+    area = db.Column(db.Float)
+    bedrooms = db.Column(db.Integer)
+    bathrooms = db.Column(db.Integer)
+    stories = db.Column(db.Integer)
+    mainroad = db.Column(db.Boolean)
+    guestroom = db.Column(db.Boolean)
+    basement = db.Column(db.Boolean)
+    hotwaterheating = db.Column(db.Boolean)
+    airconditioning = db.Column(db.Boolean)
+    parking = db.Column(db.Integer)
+    prefarea = db.Column(db.Boolean)
+    furnishingstatus = db.Column(db.String(20))
     price = db.Column(db.Float)
     favorite = db.Column(db.Boolean, default=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    user = db.relationship('User', back_populates='predictions')
+
+    def to_input(self):
+        """Rebuild the /predict request body this prediction was made from."""
+        def yn(x):
+            return "yes" if x else "no"
+
+        return {
+            "area": int(self.area) if self.area is not None and self.area.is_integer() else self.area,
+            "bedrooms": self.bedrooms,
+            "bathrooms": self.bathrooms,
+            "stories": self.stories,
+            "mainroad": yn(self.mainroad),
+            "guestroom": yn(self.guestroom),
+            "basement": yn(self.basement),
+            "hotwaterheating": yn(self.hotwaterheating),
+            "airconditioning": yn(self.airconditioning),
+            "parking": self.parking,
+            "prefarea": yn(self.prefarea),
+            "furnishingstatus": self.furnishingstatus
+        }
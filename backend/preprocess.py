@@ -14,12 +14,27 @@ Usage:
     python preprocess.py
 """
 
+import numpy as np
 import pandas as pd
 import joblib
+import hashlib
+import json
 import os
-from sklearn.preprocessing import LabelEncoder
+from joblib import Parallel, delayed
 from sklearn.model_selection import train_test_split
 
+from category_encoder import CategoryEncoder
+from data.load_data import _partition_dtypes, downcast_numeric, drop_duplicate_rows, read_csv_deduped
+
+try:
+    # Enables pandas' multithreaded CSV engine and Arrow dictionary encoding
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    CSV_ENGINE = "pyarrow"
+except ImportError:
+    pa = pc = None
+    CSV_ENGINE = "c"
+
 # Ensure paths work regardless of where script is run from
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_DIR = os.path.join(SCRIPT_DIR, "data")
@@ -29,9 +44,51 @@ MODEL_DIR = os.path.join(SCRIPT_DIR, "model")
 os.makedirs(DATA_DIR, exist_ok=True)
 os.makedirs(MODEL_DIR, exist_ok=True)
 
+# Train/test split parameters, shared by main() and load_processed_splits()
+TEST_SIZE = 0.2
+RANDOM_STATE = 42
+
+# Rows per chunk when streaming the raw CSV; 0 (default) reads it in one go
+CSV_CHUNKSIZE = int(os.environ.get("CSV_CHUNKSIZE", "0"))
+
+# Processed data is written as Parquet; PROCESSED_DATA_FORMAT=csv keeps the
+# old CSV output (also used when pyarrow isn't installed)
+PROCESSED_DATA_FORMAT = os.environ.get(
+    "PROCESSED_DATA_FORMAT", "parquet" if CSV_ENGINE == "pyarrow" else "csv"
+).lower()
+
+
+def file_fingerprint(file_path, block_size=1 << 20):
+    """Return the SHA-256 hex digest of a file, read in blocks."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def artifact_fingerprints(data_path, outputs):
+    """Return the SHA-256 digests of the input CSV and of every output.
+
+    Outputs are keyed by their path relative to this script; a missing
+    output is recorded as None.
+    """
+    return {
+        "input": file_fingerprint(data_path),
+        "outputs": {
+            os.path.relpath(path, SCRIPT_DIR): file_fingerprint(path) if os.path.exists(path) else None
+            for path in outputs
+        },
+    }
 
-def load_and_clean_data(file_path):
-    """Load dataset and perform basic cleaning."""
+
+def load_and_clean_data(file_path, chunksize=None):
+    """Load dataset and perform basic cleaning.
+
+    With chunksize set, the CSV is streamed in chunks of that many rows and
+    duplicates are dropped as it is read, so the raw file is never held in
+    memory all at once.
+    """
     print("="*60)
     print("STEP 1: LOADING AND CLEANING DATA")
     print("="*60)
@@ -43,31 +100,34 @@ def load_and_clean_data(file_path):
     
     print(f"\n✓ Loading dataset from: {file_path}")
     
-    # Load dataset
-    df = pd.read_csv(file_path)
-    print(f"  - Original shape: {df.shape}")
-    print(f"  - Columns: {df.columns.tolist()}")
-    
-    # Remove duplicates
-    original_rows = len(df)
-    df = df.drop_duplicates()
+    if chunksize:
+        # Load and remove duplicates chunk by chunk
+        df, original_rows = read_csv_deduped(file_path, chunksize=chunksize)
+        print(f"  - Original shape: {(original_rows, df.shape[1])}")
+        print(f"  - Columns: {df.columns.tolist()}")
+    else:
+        # Load dataset
+        df = pd.read_csv(file_path, engine=CSV_ENGINE)
+        print(f"  - Original shape: {df.shape}")
+        print(f"  - Columns: {df.columns.tolist()}")
+        
+        # Remove duplicates
+        original_rows = len(df)
+        df = drop_duplicate_rows(df)
     duplicates_removed = original_rows - len(df)
     print(f"\n✓ Duplicates removed: {duplicates_removed}")
     
-    # Fill missing numeric values with median
-    num_cols = df.select_dtypes(include=['int64', 'float64']).columns
-    
-    missing_info = {}
-    for col in num_cols:
-        missing_count = df[col].isna().sum()
-        if missing_count > 0:
-            missing_info[col] = missing_count
-            df[col].fillna(df[col].median(), inplace=True)
+    # Fill missing numeric values with median: one frame-wide pass for the
+    # counts, one for all medians, and a single fill of the affected columns
+    medians = df.median(numeric_only=True)
+    missing = df.isna().sum()[medians.index]
+    missing_info = missing[missing > 0].to_dict()
+    if missing_info:
+        df = df.fillna(medians[list(missing_info)])
     
     if missing_info:
-        print("\n✓ Missing values filled (with median):")
-        for col, count in missing_info.items():
-            print(f"  - {col}: {count} missing values")
+        print("\n✓ Missing values filled (with median):\n" +
+              "\n".join(f"  - {col}: {count} missing values" for col, count in missing_info.items()))
     else:
         print("\n✓ No missing values found in numeric columns")
     
@@ -76,14 +136,43 @@ def load_and_clean_data(file_path):
     return df
 
 
+def code_dtype(n_classes):
+    """Smallest signed int dtype that holds codes 0..n_classes-1 and -1 (missing)."""
+    for dtype in (np.int8, np.int16, np.int32):
+        if n_classes - 1 <= np.iinfo(dtype).max:
+            return dtype
+    return np.int64
+
+
+def factorize_sorted(values):
+    """Return (codes, sorted uniques) like pd.factorize(values, sort=True).
+
+    With pyarrow the column is dictionary-encoded by Arrow in one pass and
+    the (small) dictionary is sorted afterwards, remapping the codes so they
+    match the sorted classes. Missing values get code -1.
+    """
+    if pc is None:
+        codes, uniques = pd.factorize(values, sort=True)
+        return codes, np.asarray(uniques)
+    
+    encoded = pc.dictionary_encode(pa.array(values))
+    order = pc.array_sort_indices(encoded.dictionary).to_numpy()
+    remap = np.empty(len(order) + 1, dtype=np.int64)
+    remap[order] = np.arange(len(order))
+    remap[-1] = -1
+    indices = encoded.indices.fill_null(-1).to_numpy()
+    uniques = encoded.dictionary.take(order).to_numpy(zero_copy_only=False)
+    return remap[indices], uniques
+
+
 def encode_categorical_features(df):
-    """Encode categorical features using LabelEncoder."""
+    """Encode categorical features as pandas categorical codes."""
     print("\n" + "="*60)
     print("STEP 2: ENCODING CATEGORICAL FEATURES")
     print("="*60)
     
-    # Get categorical columns
-    cat_cols = df.select_dtypes(include=['object']).columns
+    # Get categorical columns (object or string dtype) from one dtype pass
+    _, cat_cols = _partition_dtypes(df)
     
     if len(cat_cols) == 0:
         print("\n✓ No categorical columns found to encode.")
@@ -91,19 +180,32 @@ def encode_categorical_features(df):
     
     print(f"\n✓ Found {len(cat_cols)} categorical columns: {cat_cols.tolist()}")
     
-    encoders = {}
-    df_encoded = df.copy()
-    
+    # Factorize every column up front (sorted, so the codes match the
+    # encoder's classes_) and write all the code columns back in one go.
+    # Columns are independent and the encoding runs in C++, so use a thread pool.
+    factorized = Parallel(n_jobs=-1, prefer="threads")(
+        delayed(factorize_sorted)(df[col]) for col in cat_cols
+    )
+    encoders = {col: CategoryEncoder(uniques) for col, (_, uniques) in zip(cat_cols, factorized)}
+    # Each column gets the smallest code dtype for its own vocabulary
+    codes = pd.DataFrame({
+        col: c.astype(code_dtype(len(uniques)))
+        for col, (c, uniques) in zip(cat_cols, factorized)
+    }, index=df.index)
+    
+    # Only the categorical columns change, so overwrite them in place rather
+    # than copying the whole frame first (main() rebinds to the result)
+    df[list(cat_cols)] = codes
+    df_encoded = df
+    
+    # Build the per-column report first and write it with a single print
+    lows, highs = codes.min(), codes.max()
+    lines = []
     for col in cat_cols:
-        print(f"\n  Encoding: {col}")
-        unique_values = df_encoded[col].nunique()
-        print(f"    - Unique values: {unique_values}")
-        
-        le = LabelEncoder()
-        df_encoded[col] = le.fit_transform(df_encoded[col])
-        encoders[col] = le
-        
-        print(f"    - Encoded range: [{df_encoded[col].min()}, {df_encoded[col].max()}]")
+        lines.append(f"\n  Encoding: {col}")
+        lines.append(f"    - Unique values: {len(encoders[col].classes_)}")
+        lines.append(f"    - Encoded range: [{lows[col]}, {highs[col]}]")
+    print("\n".join(lines))
     
     # Save encoders for Flask
     encoder_path = os.path.join(MODEL_DIR, "label_encoders.pkl")
@@ -126,7 +228,7 @@ def select_features_and_target(df, target_column="price"):
     
     # Separate features and target
     X = df.drop(target_column, axis=1)
-    y = df[target_column]
+    y = df[target_column].astype(np.float64)
     
     print(f"\n✓ Target column: {target_column}")
     print(f"  - Shape: {y.shape}")
@@ -148,7 +250,7 @@ def select_features_and_target(df, target_column="price"):
     return X, y
 
 
-def split_train_test(X, y, test_size=0.2, random_state=42):
+def split_train_test(X, y, test_size=TEST_SIZE, random_state=RANDOM_STATE):
     """Split data into training and testing sets."""
     print("\n" + "="*60)
     print("STEP 4: TRAIN/TEST SPLIT")
@@ -177,14 +279,38 @@ def split_train_test(X, y, test_size=0.2, random_state=42):
     print(f"  - Train mean: {y_train.mean():.2f}, std: {y_train.std():.2f}")
     print(f"  - Test mean: {y_test.mean():.2f}, std: {y_test.std():.2f}")
     
-    # Save splits
-    splits_path = os.path.join(MODEL_DIR, "splits.pkl")
-    joblib.dump((X_train, X_test, y_train, y_test), splits_path)
-    print(f"\n✓ Train/test splits saved to: {splits_path}")
-    
+    # The split is deterministic, so it isn't saved: consumers rebuild it
+    # from the processed dataset with load_processed_splits()
     return X_train, X_test, y_train, y_test
 
 
+def load_processed_splits(target_column="price", test_size=TEST_SIZE, random_state=RANDOM_STATE):
+    """Rebuild the train/test split from the processed dataset written by main()."""
+    paths = [os.path.join(DATA_DIR, f"housing_data_processed.{fmt}") for fmt in ("parquet", "csv")]
+    if PROCESSED_DATA_FORMAT == "csv":
+        paths.reverse()
+    path = next((p for p in paths if os.path.exists(p)), None)
+    if path is None:
+        raise FileNotFoundError("Processed data not found; run preprocess.py first")
+    
+    df = pd.read_parquet(path) if path.endswith(".parquet") else pd.read_csv(path)
+    feature_names = df.columns.drop(target_column)
+    
+    # Split one contiguous float32 matrix (two row takes) instead of a
+    # multi-block frame, then wrap the halves back up without copying
+    X = np.ascontiguousarray(df[feature_names].to_numpy(dtype=np.float32))
+    y = df[target_column].to_numpy(dtype=np.float64)
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=test_size, random_state=random_state
+    )
+    return (
+        pd.DataFrame(X_train, columns=feature_names, copy=False),
+        pd.DataFrame(X_test, columns=feature_names, copy=False),
+        pd.Series(y_train, name=target_column, copy=False),
+        pd.Series(y_test, name=target_column, copy=False),
+    )
+
+
 def main():
     """Main preprocessing pipeline."""
     print("\n" + "="*60)
@@ -193,10 +319,33 @@ def main():
     
     # Define paths
     data_path = os.path.join(DATA_DIR, "housing_data.csv")
-    processed_data_path = os.path.join(DATA_DIR, "housing_data_processed.csv")
+    processed_data_path = os.path.join(DATA_DIR, f"housing_data_processed.{PROCESSED_DATA_FORMAT}")
+    input_hash_path = os.path.join(MODEL_DIR, ".input_hash")
+    outputs = [
+        processed_data_path,
+        os.path.join(MODEL_DIR, "label_encoders.pkl"),
+        os.path.join(MODEL_DIR, "feature_names.pkl"),
+    ]
+    
+    # Skip the whole pipeline when neither the raw CSV nor any of the files
+    # this script wrote have changed since the last run. The outputs are
+    # checked too because data/load_data.py and utils/preprocess.py write
+    # the same encoder and feature-name pickles.
+    if os.path.exists(data_path) and all(os.path.exists(path) for path in outputs):
+        try:
+            with open(input_hash_path) as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            saved = None
+        current = artifact_fingerprints(data_path, outputs)
+        if saved == current:
+            print(f"\n✓ {data_path} is unchanged since the last run (sha256 {current['input'][:12]}...)")
+            print("  Existing artifacts are up to date; skipping preprocessing.")
+            print(f"  Delete {input_hash_path} to force a rebuild.")
+            return
     
     # Step 1: Load and clean data
-    df = load_and_clean_data(data_path)
+    df = load_and_clean_data(data_path, chunksize=CSV_CHUNKSIZE)
     
     if df is None:
         return
@@ -204,6 +353,10 @@ def main():
     # Step 2: Encode categorical features
     df_encoded, encoders = encode_categorical_features(df)
     
+    # Narrow the feature columns before they are split and saved; the
+    # target stays full precision (prices run past float32's exact range)
+    df_encoded = downcast_numeric(df_encoded, exclude=["price"])
+    
     # Step 3: Select features and target
     X, y = select_features_and_target(df_encoded, target_column="price")
     
@@ -212,12 +365,19 @@ def main():
         return
     
     # Step 4: Split into train and test sets
-    X_train, X_test, y_train, y_test = split_train_test(X, y, test_size=0.2, random_state=42)
+    X_train, X_test, y_train, y_test = split_train_test(X, y)
     
     # Save processed data
-    df_encoded.to_csv(processed_data_path, index=False)
+    if PROCESSED_DATA_FORMAT == "csv":
+        df_encoded.to_csv(processed_data_path, index=False)
+    else:
+        df_encoded.to_parquet(processed_data_path, compression="snappy", index=False)
     print(f"\n✓ Processed data saved to: {processed_data_path}")
     
+    # Remember which input these artifacts came from, and what they were
+    with open(input_hash_path, "w") as f:
+        json.dump(artifact_fingerprints(data_path, outputs), f, indent=2)
+    
     # Final summary
     print("\n" + "="*60)
     print("PREPROCESSING COMPLETED SUCCESSFULLY!")
@@ -227,7 +387,6 @@ def main():
     print(f"  ✓ {processed_data_path}")
     print(f"  ✓ {os.path.join(MODEL_DIR, 'label_encoders.pkl')}")
     print(f"  ✓ {os.path.join(MODEL_DIR, 'feature_names.pkl')}")
-    print(f"  ✓ {os.path.join(MODEL_DIR, 'splits.pkl')}")
     
     print(f"\n📊 Dataset summary:")
     print(f"  - Total samples: {len(df_encoded)}")
@@ -0,0 +1,47 @@
+import os
+import threading
+import time
+
+
+class MemoryStore:
+    """Process-local stand-in for the few Redis calls the API uses."""
+
+    SWEEP_THRESHOLD = 10000
+
+    def __init__(self):
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def setex(self, key, ttl, value):
+        with self._lock:
+            if len(self._data) >= self.SWEEP_THRESHOLD:
+                self._sweep()
+            self._data[key] = (value, time.monotonic() + ttl)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= time.monotonic():
+                del self._data[key]
+                return None
+            return entry[0]
+
+    def delete(self, *keys):
+        with self._lock:
+            return sum(self._data.pop(k, None) is not None for k in keys)
+
+    def _sweep(self):
+        now = time.monotonic()
+        for k in [k for k, (_, exp) in self._data.items() if exp <= now]:
+            del self._data[k]
+
+
+def get_store():
+    """Return a Redis client when REDIS_URL is set, else an in-memory store."""
+    url = os.environ.get('REDIS_URL')
+    if url:
+        import redis
+        return redis.Redis.from_url(url, decode_responses=True)
+    return MemoryStore()
@@ -0,0 +1,47 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+# category_encoder lives in backend/, one level up from this file
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from category_encoder import CategoryEncoder
+
+
+class CategoryEncoderTransformTest(unittest.TestCase):
+
+    def setUp(self):
+        self.str_encoder = CategoryEncoder().fit(["semi-furnished", "furnished", "unfurnished"])
+        self.int_encoder = CategoryEncoder().fit([3, 1, 2])
+
+    def test_known_labels(self):
+        self.assertEqual(self.str_encoder.transform(["unfurnished", "furnished"]).tolist(), [2, 0])
+        self.assertEqual(self.int_encoder.transform([2, 3]).tolist(), [1, 2])
+
+    def test_unseen_label(self):
+        with self.assertRaisesRegex(ValueError, r"previously unseen labels: \['partly'\]"):
+            self.str_encoder.transform(["furnished", "partly"])
+        with self.assertRaisesRegex(ValueError, r"previously unseen labels: \[2\.5\]"):
+            self.int_encoder.transform([2.5])
+
+    def test_missing_label(self):
+        with self.assertRaisesRegex(ValueError, "previously unseen labels"):
+            self.str_encoder.transform(["furnished", None])
+
+    def test_numeric_labels_against_string_classes(self):
+        with self.assertRaisesRegex(ValueError, r"previously unseen labels: \[1\]"):
+            self.str_encoder.transform(["furnished", 1])
+
+    def test_string_labels_against_numeric_classes(self):
+        with self.assertRaisesRegex(ValueError, r"previously unseen labels: \['a'\]"):
+            self.int_encoder.transform(np.array(["a"]))
+
+    def test_inverse_transform_round_trip(self):
+        codes = self.str_encoder.transform(["furnished", "unfurnished"])
+        self.assertEqual(self.str_encoder.inverse_transform(codes).tolist(), ["furnished", "unfurnished"])
+
+
+if __name__ == "__main__":
+    unittest.main()
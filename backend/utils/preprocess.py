@@ -1,75 +1,89 @@
+import os
+import sys
+
+import numpy as np
 import pandas as pd
 import joblib
-from sklearn.preprocessing import LabelEncoder
-from sklearn.model_selection import train_test_split
-
-print("Starting Preprocessing...")
-print("==================================================")
-
-# ----------------------------------------------------
-# 1. LOAD DATA
-# ----------------------------------------------------
-df = pd.read_csv("backend/data/housing_data.csv")
-
-print("Dataset Loaded:", df.shape)
-
-# ----------------------------------------------------
-# 2. CLEANING
-# ----------------------------------------------------
-df = df.drop_duplicates()
-
-# Safety fill numeric
-df = df.fillna(df.median(numeric_only=True))
-
-# ✅ FIX ADDED HERE (BEFORE ENCODING)
-df["area"] = pd.to_numeric(df["area"], errors="coerce")
-
-# ----------------------------------------------------
-# 3. ENCODE CATEGORICAL FEATURES
-# ----------------------------------------------------
-cat_cols = [
-    "mainroad",
-    "guestroom",
-    "basement",
-    "hotwaterheating",
-    "airconditioning",
-    "prefarea",
-    "furnishingstatus"
-]
-
-encoders = {}
-
-for col in cat_cols:
-    le = LabelEncoder()
-    df[col] = le.fit_transform(df[col])
-    encoders[col] = le
-
-# Save encoders
-joblib.dump(encoders, "backend/model/label_encoders.pkl")
-print("✓ Encoders saved")
-
-# ----------------------------------------------------
-# 4. FEATURES & TARGET
-# ----------------------------------------------------
-X = df.drop("price", axis=1)
-y = df["price"]
-
-joblib.dump(X.columns.tolist(), "backend/model/feature_names.pkl")
-print("✓ Feature names saved")
-
-# ----------------------------------------------------
-# 5. TRAIN TEST SPLIT
-# ----------------------------------------------------
-X_train, X_test, y_train, y_test = train_test_split(
-    X, y, test_size=0.2, random_state=42
-)
-
-joblib.dump((X_train, X_test, y_train, y_test),
-            "backend/model/splits.pkl")
-
-print("✓ Data splits saved")
-
-# ----------------------------------------------------
-print("Preprocessing Completed Successfully")
-print("Train Shape:", X_train.shape)
-print("Test Shape:", X_test.shape)
+from joblib import Parallel, delayed
+
+# category_encoder lives in backend/, one level up from this script
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from category_encoder import CategoryEncoder
+from data.load_data import downcast_numeric, drop_duplicate_rows
+
+
+def main():
+    """Run the preprocessing pipeline and save the encoders and feature names."""
+    print("Starting Preprocessing...")
+    print("==================================================")
+
+    # ----------------------------------------------------
+    # 1. LOAD DATA
+    # ----------------------------------------------------
+    df = pd.read_csv("backend/data/housing_data.csv")
+
+    # ✅ FIX ADDED HERE (BEFORE ENCODING)
+    # Make area numeric as part of loading, straight to float32, so the
+    # cleaning below works on a numeric column. A read-time dtype isn't
+    # possible: the raw file has junk like "4SCRIPTa" in this column, which
+    # read_csv(dtype=...) rejects, so those values are coerced to NaN here.
+    df["area"] = pd.to_numeric(df["area"], errors="coerce", downcast="float")
+
+    print("Dataset Loaded:", df.shape)
+
+    # ----------------------------------------------------
+    # 2. CLEANING
+    # ----------------------------------------------------
+    df = drop_duplicate_rows(df)
+
+    # Safety fill numeric
+    df = df.fillna(df.median(numeric_only=True))
+
+    # ----------------------------------------------------
+    # 3. ENCODE CATEGORICAL FEATURES
+    # ----------------------------------------------------
+    cat_cols = [
+        "mainroad",
+        "guestroom",
+        "basement",
+        "hotwaterheating",
+        "airconditioning",
+        "prefarea",
+        "furnishingstatus"
+    ]
+
+    # One sorted factorize per column, then a single block assignment
+    factorized = Parallel(n_jobs=-1, prefer="threads")(
+        delayed(pd.factorize)(df[col], sort=True) for col in cat_cols
+    )
+    # Every column here has only a handful of classes, so int8 codes suffice
+    df[cat_cols] = np.column_stack([codes for codes, _ in factorized]).astype(np.int8)
+    encoders = {col: CategoryEncoder(uniques) for col, (_, uniques) in zip(cat_cols, factorized)}
+
+    # Save encoders
+    joblib.dump(encoders, "backend/model/label_encoders.pkl")
+    print("✓ Encoders saved")
+
+    # ----------------------------------------------------
+    # 4. FEATURES & TARGET
+    # ----------------------------------------------------
+    # Shrink the feature columns (int64 -> smallest int, float64 -> float32);
+    # the price target keeps full precision
+    df = downcast_numeric(df, exclude=["price"])
+
+    X = df.drop("price", axis=1)
+    y = df["price"].astype(np.float64)
+
+    joblib.dump(X.columns.tolist(), "backend/model/feature_names.pkl")
+    print("✓ Feature names saved")
+
+    # ----------------------------------------------------
+    # No train/test split here: train_model.py splits the processed data
+    # written by backend/preprocess.py (preprocess.load_processed_splits())
+    print("Preprocessing Completed Successfully")
+    print("Features Shape:", X.shape)
+    print("Target Shape:", y.shape)
+
+if __name__ == "__main__":
+    main()